@@ -83,6 +83,22 @@ lr_handle_free_list(char ***list)
     *list = NULL;
 }
 
+/* Default values of a new handle, everything not listed here is 0/NULL */
+static const LrHandle lr_handle_defaults = {
+    .checks                     = LR_CHECK_CHECKSUM,
+    .ipresolve                  = LRO_IPRESOLVE_DEFAULT,
+    .fastestmirrormaxage        = LRO_FASTESTMIRRORMAXAGE_DEFAULT,
+    .maxparalleldownloads       = LRO_MAXPARALLELDOWNLOADS_DEFAULT,
+    .maxdownloadspermirror      = LRO_MAXDOWNLOADSPERMIRROR_DEFAULT,
+    .lowspeedlimit              = LRO_LOWSPEEDLIMIT_DEFAULT,
+    .sslverifypeer              = 1,
+    .sslverifyhost              = 2,
+    .allowed_mirror_failures    = LRO_ALLOWEDMIRRORFAILURES_DEFAULT,
+    .adaptivemirrorsorting      = LRO_ADAPTIVEMIRRORSORTING_DEFAULT,
+    .mirrorlist_fd              = -1,
+    .metalink_fd                = -1,
+};
+
 LrHandle *
 lr_handle_init()
 {
@@ -92,20 +108,9 @@ lr_handle_init()
     if (!curl)
         return NULL;
 
-    handle = lr_malloc0(sizeof(LrHandle));
+    handle = lr_malloc(sizeof(LrHandle));
+    *handle = lr_handle_defaults;
     handle->curl_handle = curl;
-    handle->fastestmirrormaxage = LRO_FASTESTMIRRORMAXAGE_DEFAULT;
-    handle->mirrorlist_fd = -1;
-    handle->metalink_fd = -1;
-    handle->checks |= LR_CHECK_CHECKSUM;
-    handle->maxparalleldownloads = LRO_MAXPARALLELDOWNLOADS_DEFAULT;
-    handle->maxdownloadspermirror = LRO_MAXDOWNLOADSPERMIRROR_DEFAULT;
-    handle->lowspeedlimit = LRO_LOWSPEEDLIMIT_DEFAULT;
-    handle->sslverifypeer = 1;
-    handle->sslverifyhost = 2;
-    handle->ipresolve = LRO_IPRESOLVE_DEFAULT;
-    handle->allowed_mirror_failures = LRO_ALLOWEDMIRRORFAILURES_DEFAULT;
-    handle->adaptivemirrorsorting = LRO_ADAPTIVEMIRRORSORTING_DEFAULT;
     handle->gnupghomedir = g_strdup(LRO_GNUPGHOMEDIR_DEFAULT);
 
     return handle;
@@ -35,97 +35,92 @@ G_BEGIN_DECLS
 
 struct _LrHandle {
 
-    CURL *curl_handle; /*!<
-        CURL handle */
+    // Options with scalar values (int sized first, then long sized)
 
     int update; /*!<
         Just update existing repo */
 
-    LrInternalMirrorlist *internal_mirrorlist; /*!<
-        Internal list of mirrors (Real used mirrorlist = baseurl + mirrors) */
-
-    char **urls; /*!<
-        URLs of repositories */
-
-    LrInternalMirrorlist *urls_mirrors; /*!<
-        Mirrors from urls */
+    int local; /*!<
+        Do not duplicate local data */
 
     int fastestmirror; /*!<
         Should be internal mirrorlist sorted by connection time */
 
-    char *fastestmirrorcache; /*!<
-        Path to the fastestmirror's cache file. */
-
-    long fastestmirrormaxage; /*!<
-        Maximum age of a record in cache (seconds). */
+    LrRepotype repotype; /*!<
+        Type of repository */
 
-    LrFastestMirrorCb fastestmirrorcb; /*!<
-        Fastest mirror detection status callback */
+    LrChecks checks; /*!<
+        Which check sould be applied */
 
-    void *fastestmirrordata; /*!<
-        User data for fastestmirrorcb. */
+    int ignoremissing; /*!<
+        Ignore missing metadata files */
 
-    // Mirrorlist related stuff
+    int interruptible; /*!<
+        Setup own SIGTERM handler*/
 
-    char *mirrorlist; /*!<
-        XXX: Deprecated!
-        List of or metalink */
+    int fetchmirrors;   /*!<
+        Only fetch and parse mirrorlist. */
 
-    char *mirrorlisturl; /*!<
-        Mirrorlist URL */
+    int maxmirrortries; /*!<
+        Try at most this number of mirrors. */
 
-    int mirrorlist_fd; /*!<
-        Raw downloaded mirrorlist file */
+    LrIpResolveType ipresolve; /*!<
+        What kind of IP addresses to use when resolving host names. */
 
-    LrInternalMirrorlist *mirrorlist_mirrors; /*!<
-        Mirrors from mirrorlist */
+    long fastestmirrormaxage; /*!<
+        Maximum age of a record in cache (seconds). */
 
-    // Metalink related stuff
+    long maxparalleldownloads; /* !<
+        Maximum number of parallel downloads. */
 
-    char * metalinkurl; /*!<
-        Metalink URL */
+    long maxdownloadspermirror; /* !<
+        Maximum number of parallel downloads per a single mirror. */
 
-    int metalink_fd; /*!<
-        Raw downloaded metalink file */
+    long lowspeedlimit; /*!<
+        The time in seconds that the transfer should be below the
+        LRO_LOWSPEEDLIMIT for the library to consider it too slow
+        and abort. */
 
-    LrInternalMirrorlist *metalink_mirrors; /*!<
-        Mirrors from metalink */
+    long sslverifypeer; /*!<
+        Determines whether verify the autenticity of the peer's certificate */
 
-    LrMetalink *metalink; /*!<
-        Parsed metalink for repomd.xml */
+    long sslverifyhost; /*!<
+        Determines whether the server name should be checked agains the name
+        in the certificate */
 
-    LrInternalMirrorlist *mirrors;  /*!<
-        Mirrors from metalink or mirrorlist */
+    long allowed_mirror_failures; /*!<
+        Number of allowed failed transfers, when there are no
+        successfull ones, before a mirror gets ignored. */
 
-    int local; /*!<
-        Do not duplicate local data */
+    long adaptivemirrorsorting; /*!<
+        See: LRO_ADAPTIVEMIRRORSORTING */
 
-    char *used_mirror; /*!<
-        Finally used mirror (if any) */
+    gint64 maxspeed; /*!<
+        Max speed in bytes per sec */
 
-    char *destdir; /*!<
-        Destination directory */
+    // Options with string and list values
 
-    char *useragent; /*!<
-        User agent */
+    char **urls; /*!<
+        URLs of repositories */
 
-    LrRepotype repotype; /*!<
-        Type of repository */
+    char *fastestmirrorcache; /*!<
+        Path to the fastestmirror's cache file. */
 
-    LrChecks checks; /*!<
-        Which check sould be applied */
+    char *mirrorlist; /*!<
+        XXX: Deprecated!
+        List of or metalink */
 
-    LrProgressCb user_cb; /*!<
-        User progress callback */
+    char *mirrorlisturl; /*!<
+        Mirrorlist URL */
 
-    void *user_data; /*!<
-        User data for callback */
+    char * metalinkurl; /*!<
+        Metalink URL */
 
-    int ignoremissing; /*!<
-        Ignore missing metadata files */
+    char *destdir; /*!<
+        Destination directory */
 
-    int interruptible; /*!<
-        Setup own SIGTERM handler*/
+    char *useragent; /*!<
+        User agent */
 
     char **yumdlist; /*!<
         Repomd data typenames to download NULL - Download all
@@ -135,51 +130,60 @@ struct _LrHandle {
         Repomd data typenames to skip (blacklist). NULL as argument will
         disable blacklist. */
 
-    int fetchmirrors;   /*!<
-        Only fetch and parse mirrorlist. */
+    LrUrlVars *urlvars; /*!<
+        List with url substitutions */
 
-    int maxmirrortries; /*!<
-        Try at most this number of mirrors. */
+    gchar *gnupghomedir; /*!<
+        GNUPG home dir. */
 
-    long maxparalleldownloads; /* !<
-        Maximum number of parallel downloads. */
+    // Callbacks and their user data
 
-    long maxdownloadspermirror; /* !<
-        Maximum number of parallel downloads per a single mirror. */
+    LrFastestMirrorCb fastestmirrorcb; /*!<
+        Fastest mirror detection status callback */
 
-    LrUrlVars *urlvars; /*!<
-        List with url substitutions */
+    void *fastestmirrordata; /*!<
+        User data for fastestmirrorcb. */
 
-    long lowspeedlimit; /*!<
-        The time in seconds that the transfer should be below the
-        LRO_LOWSPEEDLIMIT for the library to consider it too slow
-        and abort. */
+    LrProgressCb user_cb; /*!<
+        User progress callback */
+
+    void *user_data; /*!<
+        User data for callback */
 
     LrHandleMirrorFailureCb hmfcb; /*!<
         Callaback called when a repodata download from a mirror fails. */
 
-    gint64 maxspeed; /*!<
-        Max speed in bytes per sec */
+    // Internal state
 
-    long sslverifypeer; /*!<
-        Determines whether verify the autenticity of the peer's certificate */
+    CURL *curl_handle; /*!<
+        CURL handle */
 
-    long sslverifyhost; /*!<
-        Determines whether the server name should be checked agains the name
-        in the certificate */
+    LrInternalMirrorlist *internal_mirrorlist; /*!<
+        Internal list of mirrors (Real used mirrorlist = baseurl + mirrors) */
 
-    LrIpResolveType ipresolve; /*!<
-        What kind of IP addresses to use when resolving host names. */
+    LrInternalMirrorlist *urls_mirrors; /*!<
+        Mirrors from urls */
 
-    long allowed_mirror_failures; /*!<
-        Number of allowed failed transfers, when there are no
-        successfull ones, before a mirror gets ignored. */
+    int mirrorlist_fd; /*!<
+        Raw downloaded mirrorlist file */
 
-    long adaptivemirrorsorting; /*!<
-        See: LRO_ADAPTIVEMIRRORSORTING */
+    LrInternalMirrorlist *mirrorlist_mirrors; /*!<
+        Mirrors from mirrorlist */
 
-    gchar *gnupghomedir; /*!<
-        GNUPG home dir. */
+    int metalink_fd; /*!<
+        Raw downloaded metalink file */
+
+    LrInternalMirrorlist *metalink_mirrors; /*!<
+        Mirrors from metalink */
+
+    LrMetalink *metalink; /*!<
+        Parsed metalink for repomd.xml */
+
+    LrInternalMirrorlist *mirrors;  /*!<
+        Mirrors from metalink or mirrorlist */
+
+    char *used_mirror; /*!<
+        Finally used mirror (if any) */
 };
 
 /** Return new CURL easy handle with some default options setted.
@@ -1140,6 +1140,11 @@ class Handle(_librepo.Handle):
     Handle hold information about a repository and configuration for
     downloading from the repository.
 
+    Options can be also passed as keyword arguments, the keyword names
+    are the attribute names listed below::
+
+        h = librepo.Handle(repotype=librepo.LR_YUMREPO, destdir="repo")
+
     **Attributes:**
 
     .. attribute:: update:
@@ -1324,52 +1329,14 @@ class Handle(_librepo.Handle):
 
     """
 
-    def setopt(self, option, val):
-        """Set option to :class:`.Handle` directly.
+    # Attributes are provided by the _librepo.Handle type itself,
+    # no instance __dict__ is needed
+    __slots__ = ('__weakref__',)
 
-        :param option: One of: :ref:`handle-options-label`
-        :returns: *None*
-
-        Example::
-
-            # The command:
-            h.setopt(librepo.LRO_URLS, ["http://ftp.linux.ncsu.edu/pub/fedora/linux/releases/17/Everything/i386/os/"])
-            # is equivalent to:
-            h.urls(["http://ftp.linux.ncsu.edu/pub/fedora/linux/releases/17/Everything/i386/os/"])
-        """
-
-        if (option == LRO_URLS and (not isinstance(val, list) and val is not None)):
-            import warnings
-            warnings.warn("Using string value for LRO_URLS is deprecated, " \
-                          "use list of strings instead", DeprecationWarning)
-            val = [val]
-
-        _librepo.Handle.setopt(self, option, val)
-
-    def __setattr__(self, attr, val):
-        if attr not in ATTR_TO_LRO and attr in ATTR_TO_LRI:
-            raise AttributeError("Set of attribute '%s' is not supported" % attr)
-        elif attr not in ATTR_TO_LRO:
-            raise AttributeError("'%s' object has no attribute '%s'" % \
-                                 (self.__class__.__name__, attr))
-        self.setopt(ATTR_TO_LRO[attr], val)
-
-    def __getattr__(self, attr):
-        if attr not in ATTR_TO_LRI and attr in ATTR_TO_LRO:
-            raise AttributeError("Read of attribute '%s' is not supported" % attr)
-        elif attr not in ATTR_TO_LRI:
-            raise AttributeError("'%s' object has no attribute '%s'" % \
-                                 (self.__class__.__name__, attr))
-        return _librepo.Handle.getinfo(self, ATTR_TO_LRI[attr])
-
-    def getinfo(self, option):
-        """Get information from :class:`.Handle`.
-
-        :param option: One of :ref:`handle-info-options-label`
-        :returns: Value for the specified option or
-                  *None* if the option is not set.
-        """
-        return _librepo.Handle.getinfo(self, option)
+    # Implemented by _librepo.Handle, listed here to get them documented
+    setopt = _librepo.Handle.setopt
+    setopts = _librepo.Handle.setopts
+    getinfo = _librepo.Handle.getinfo
 
     def download(self, url, dest=None, checksum_type=CHECKSUM_UNKNOWN,
                  checksum=None, expectedsize=0, base_url=None, resume=0):
@@ -1472,12 +1439,6 @@ class Result(_librepo.Result):
         """
         return _librepo.Result.getinfo(self, option)
 
-    def __getattr__(self, attr):
-        if attr not in ATTR_TO_LRR:
-            raise AttributeError("'%s' object has no attribute '%s'" % \
-                                 (self.__class__.__name__, attr))
-        return self.getinfo(ATTR_TO_LRR[attr])
-
 # Functions
 
 def download_packages(list, failfast=False):
@@ -21,6 +21,7 @@
 #include <Python.h>
 #undef NDEBUG
 #include <assert.h>
+#include <string.h>
 
 #include "librepo/librepo.h"
 
@@ -34,6 +35,15 @@
 
 #include "globalstate-py.h"  // GIL Hack
 
+/* setopt() and getinfo() are called very often, use the vectorcall
+ * convention (no argument tuple) where the interpreter supports it. */
+#if PY_VERSION_HEX >= 0x03070000
+#define HANDLE_USE_FASTCALL
+#define HANDLE_OPTION_METH_FLAGS    METH_FASTCALL
+#else
+#define HANDLE_OPTION_METH_FLAGS    METH_VARARGS
+#endif
+
 typedef struct {
     PyObject_HEAD
     LrHandle *handle;
@@ -80,12 +90,38 @@ check_HandleStatus(const _HandleObject *self)
 
 /* Callback stuff */
 
+/* Call the python callback with positional arguments from the args array.
+ * Use the vectorcall protocol where available to avoid the argument tuple.
+ */
+static PyObject *
+call_callback(PyObject *cb, PyObject **args, size_t nargs)
+{
+#if PY_VERSION_HEX >= 0x03090000
+    return PyObject_Vectorcall(cb, args, nargs, NULL);
+#elif PY_VERSION_HEX >= 0x03080000
+    return _PyObject_Vectorcall(cb, args, nargs, NULL);
+#else
+    PyObject *tuple, *result;
+
+    tuple = PyTuple_New(nargs);
+    if (!tuple)
+        return NULL;
+    for (size_t x = 0; x < nargs; x++) {
+        Py_INCREF(args[x]);
+        PyTuple_SET_ITEM(tuple, x, args[x]);
+    }
+    result = PyObject_Call(cb, tuple, NULL);
+    Py_DECREF(tuple);
+    return result;
+#endif
+}
+
 static int
 progress_callback(void *data, double total_to_download, double now_downloaded)
 {
     int ret = LR_CB_OK; // Assume everything will be ok
     _HandleObject *self;
-    PyObject *user_data, *result;
+    PyObject *user_data, *result, *args[3];
 
     self = (_HandleObject *)data;
     if (!self->progress_cb)
@@ -97,8 +133,15 @@ progress_callback(void *data, double total_to_download, double now_downloaded)
         user_data = Py_None;
 
     EndAllowThreads(self->state);
-    result = PyObject_CallFunction(self->progress_cb,
-                        "(Odd)", user_data, total_to_download, now_downloaded);
+    args[0] = user_data;
+    args[1] = PyFloat_FromDouble(total_to_download);
+    args[2] = PyFloat_FromDouble(now_downloaded);
+    if (args[1] && args[2])
+        result = call_callback(self->progress_cb, args, 3);
+    else
+        result = NULL;
+    Py_XDECREF(args[1]);
+    Py_XDECREF(args[2]);
 
     if (!result) {
         // Exception raised in callback leads to the abortion
@@ -131,7 +174,7 @@ static void
 fastestmirror_callback(void *data, LrFastestMirrorStages stage, void *ptr)
 {
     _HandleObject *self;
-    PyObject *user_data, *result, *pydata;
+    PyObject *user_data, *result, *pydata, *args[3];
 
     self = (_HandleObject *)data;
     if (!self->fastestmirror_cb)
@@ -142,6 +185,9 @@ fastestmirror_callback(void *data, LrFastestMirrorStages stage, void *ptr)
     else
         user_data = Py_None;
 
+    // Python objects can be created only with the GIL held
+    EndAllowThreads(self->state);
+
     if (!ptr) {
         pydata = Py_None;
     } else {
@@ -159,15 +205,21 @@ fastestmirror_callback(void *data, LrFastestMirrorStages stage, void *ptr)
         }
     }
 
-    EndAllowThreads(self->state);
-    result = PyObject_CallFunction(self->fastestmirror_cb,
-                        "(OlO)", user_data, (long) stage, pydata);
+    args[0] = user_data;
+    args[1] = PyLong_FromLong((long) stage);
+    args[2] = pydata;
+    if (args[1] && args[2])
+        result = call_callback(self->fastestmirror_cb, args, 3);
+    else
+        result = NULL;
     Py_XDECREF(result);
-    BeginAllowThreads(self->state);
+    Py_XDECREF(args[1]);
 
     if (pydata != Py_None)
         Py_XDECREF(pydata);
 
+    BeginAllowThreads(self->state);
+
     return;
 }
 
@@ -176,7 +228,7 @@ hmf_callback(void *data, const char *msg, const char *url, const char *metadata)
 {
     int ret = LR_CB_OK; // Assume everything will be ok
     _HandleObject *self;
-    PyObject *user_data, *result;
+    PyObject *user_data, *result, *args[4];
 
     self = (_HandleObject *)data;
     if (!self->hmf_cb)
@@ -188,8 +240,17 @@ hmf_callback(void *data, const char *msg, const char *url, const char *metadata)
         user_data = Py_None;
 
     EndAllowThreads(self->state);
-    result = PyObject_CallFunction(self->hmf_cb,
-                        "(Osss)", user_data, msg, url, metadata);
+    args[0] = user_data;
+    args[1] = PyStringOrNone_FromString(msg);
+    args[2] = PyStringOrNone_FromString(url);
+    args[3] = PyStringOrNone_FromString(metadata);
+    if (args[1] && args[2] && args[3])
+        result = call_callback(self->hmf_cb, args, 4);
+    else
+        result = NULL;
+    Py_XDECREF(args[1]);
+    Py_XDECREF(args[2]);
+    Py_XDECREF(args[3]);
 
     if (!result) {
         // Exception raised in callback leads to the abortion
@@ -239,13 +300,16 @@ handle_new(PyTypeObject *type,
     return (PyObject *)self;
 }
 
+static int set_kwargs_options(_HandleObject *self, PyObject *kwds);
+
 static int
 handle_init(_HandleObject *self, PyObject *args, PyObject *kwds)
 {
-    char *kwlist[] = {NULL};
-
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|", kwlist))
+    if (PyTuple_GET_SIZE(args) != 0) {
+        PyErr_SetString(PyExc_TypeError,
+                        "Handle() takes no positional arguments");
         return -1;
+    }
 
     self->handle = lr_handle_init();
     if (self->handle == NULL) {
@@ -253,6 +317,9 @@ handle_init(_HandleObject *self, PyObject *args, PyObject *kwds)
         return -1;
     }
 
+    if (kwds && set_kwargs_options(self, kwds))
+        return -1;
+
     return 0;
 }
 
@@ -269,709 +336,911 @@ handle_dealloc(_HandleObject *o)
     Py_TYPE(o)->tp_free(o);
 }
 
+/* Option handlers
+ *
+ * Every handler serves one kind of option. setopt_option() and
+ * getinfo_option() pick the handler from a table indexed directly
+ * by the option number.
+ */
+
+typedef PyObject *(*SetoptHandler)(_HandleObject *self,
+                                   LrHandleOption option,
+                                   PyObject *obj);
+
+typedef PyObject *(*GetinfoHandler)(_HandleObject *self,
+                                    LrHandleInfoOption option);
+
+/* Finish a setopt handler - raise an exception from tmp_err on failure */
 static PyObject *
-py_setopt(_HandleObject *self, PyObject *args)
+setopt_result(gboolean res, GError **tmp_err)
 {
-    int option;
-    PyObject *obj;
-    gboolean res = TRUE;
+    if (!res)
+        RETURN_ERROR(tmp_err, -1, NULL);
+    Py_RETURN_NONE;
+}
+
+/*
+ * Options with string arguments (NULL is supported)
+ */
+static PyObject *
+setopt_string(_HandleObject *self, LrHandleOption option, PyObject *obj)
+{
+    gboolean res;
     GError *tmp_err = NULL;
+    const char *str = NULL;
+#if PY_MAJOR_VERSION < 3
+    PyObject *bytes = NULL;
+#endif
 
-    if (!PyArg_ParseTuple(args, "iO:py_setopt", &option, &obj))
-        return NULL;
-    if (check_HandleStatus(self))
+    // librepo keeps its own copy of the string, so the UTF-8 buffer
+    // cached in the unicode object can be passed without copying it
+    if (PyUnicode_Check(obj)) {
+#if PY_MAJOR_VERSION >= 3
+        str = PyUnicode_AsUTF8(obj);
+        if (!str) return NULL;
+#else
+        bytes = PyUnicode_AsUTF8String(obj);
+        if (!bytes) return NULL;
+        str = PyBytes_AsString(bytes);
+#endif
+    } else if (PyBytes_Check(obj)) {
+        str = PyBytes_AsString(obj);
+    } else if (obj != Py_None) {
+        PyErr_SetString(PyExc_TypeError,
+                    "Only string or None is supported with this option");
         return NULL;
+    }
 
-    switch (option) {
-
-    /*
-     * Options with string arguments (NULL is supported)
-     */
-    case LRO_MIRRORLIST:
-    case LRO_MIRRORLISTURL:
-    case LRO_METALINKURL:
-    case LRO_USERPWD:
-    case LRO_PROXY:
-    case LRO_PROXYUSERPWD:
-    case LRO_DESTDIR:
-    case LRO_USERAGENT:
-    case LRO_FASTESTMIRRORCACHE:
-    case LRO_GNUPGHOMEDIR:
-    {
-        char *str = NULL, *alloced = NULL;
+    res = lr_handle_setopt(self->handle, &tmp_err, option, str);
+#if PY_MAJOR_VERSION < 3
+    Py_XDECREF(bytes);
+#endif
+    return setopt_result(res, &tmp_err);
+}
 
-        if (PyUnicode_Check(obj)) {
-            PyObject *bytes = PyUnicode_AsUTF8String(obj);
-            if (!bytes) return NULL;
-            str = alloced = g_strdup(PyBytes_AsString(bytes));
-            Py_XDECREF(bytes);
-        } else if (PyBytes_Check(obj)) {
-            str = PyBytes_AsString(obj);
-        } else if (obj != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                        "Only string or None is supported with this option");
-            return NULL;
-        }
+/* Truth value of the obj or -1 on error.
+ * Bools and ints are checked without the number protocol call. */
+static inline int
+is_true(PyObject *obj)
+{
+    if (obj == Py_True)
+        return 1;
+    if (obj == Py_False)
+        return 0;
+#if PY_MAJOR_VERSION < 3
+    if (PyInt_CheckExact(obj))
+        return PyInt_AS_LONG(obj) != 0;
+#elif PY_VERSION_HEX < 0x030C0000
+    // Zero is the only int with zero size (int layout differs since 3.12)
+    if (PyLong_CheckExact(obj))
+        return Py_SIZE(obj) != 0;
+#endif
+    return PyObject_IsTrue(obj);
+}
 
-        res = lr_handle_setopt(self->handle,
-                               &tmp_err,
-                               (LrHandleOption)option,
-                               str);
-        g_free(alloced);
-        break;
-    }
+/*
+ * Options with long/int (boolean) arguments
+ */
+static PyObject *
+setopt_bool(_HandleObject *self, LrHandleOption option, PyObject *obj)
+{
+    gboolean res;
+    GError *tmp_err = NULL;
+    long d;
 
-    /*
-     * Options with long/int (boolean) arguments
-     */
-    case LRO_UPDATE:
-    case LRO_LOCAL:
-    case LRO_HTTPAUTH:
-    case LRO_PROXYAUTH:
-    case LRO_GPGCHECK:
-    case LRO_IGNOREMISSING:
-    case LRO_CHECKSUM:
-    case LRO_INTERRUPTIBLE:
-    case LRO_FETCHMIRRORS:
-    case LRO_FASTESTMIRROR:
-    case LRO_SSLVERIFYPEER:
-    case LRO_SSLVERIFYHOST:
-    case LRO_ADAPTIVEMIRRORSORTING:
+    // Default values for None attribute
+    if (obj == Py_None && (option == LRO_SSLVERIFYPEER ||
+                           option == LRO_SSLVERIFYHOST))
     {
-        long d;
-
-        // Default values for None attribute
-        if (obj == Py_None && (option == LRO_SSLVERIFYPEER ||
-                               option == LRO_SSLVERIFYHOST))
-        {
-            d = 1;
-        } else if (obj == Py_None && option == LRO_ADAPTIVEMIRRORSORTING) {
-            d = LRO_ADAPTIVEMIRRORSORTING_DEFAULT;
-        // end of default attributes
-        } else if (PyObject_IsTrue(obj) == 1)
-            d = 1;
-        else if (PyObject_IsTrue(obj) == 0)
-            d = 0;
-        else {
-            PyErr_SetString(PyExc_TypeError, "Only Int, Long or Bool are supported with this option");
-            return NULL;
-        }
-
-        res = lr_handle_setopt(self->handle,
-                               &tmp_err,
-                               (LrHandleOption)option,
-                               d);
-        break;
+        d = 1;
+    } else if (obj == Py_None && option == LRO_ADAPTIVEMIRRORSORTING) {
+        d = LRO_ADAPTIVEMIRRORSORTING_DEFAULT;
+    // end of default attributes
+    } else if ((d = is_true(obj)) == -1) {
+        PyErr_SetString(PyExc_TypeError, "Only Int, Long or Bool are supported with this option");
+        return NULL;
     }
 
-    /*
-     * Options with long/int arguments
-     */
-    case LRO_PROXYTYPE:
-    case LRO_REPOTYPE:
-    case LRO_FASTESTMIRRORMAXAGE:
-    case LRO_LOWSPEEDTIME:
-    case LRO_LOWSPEEDLIMIT:
-    case LRO_IPRESOLVE:
-    case LRO_ALLOWEDMIRRORFAILURES:
-    {
-        int badarg = 0;
-        long d;
+    res = lr_handle_setopt(self->handle, &tmp_err, option, d);
+    return setopt_result(res, &tmp_err);
+}
+
+/*
+ * Options with long/int arguments
+ */
+static PyObject *
+setopt_long(_HandleObject *self, LrHandleOption option, PyObject *obj)
+{
+    gboolean res;
+    GError *tmp_err = NULL;
+    int badarg = 0;
+    long d;
 
-        if (PyLong_Check(obj))
-            d = PyLong_AsLong(obj);
+    if (PyLong_Check(obj))
+        d = PyLong_AsLong(obj);
 #if PY_MAJOR_VERSION < 3
-        else if (PyInt_Check(obj))
-            d = PyInt_AS_LONG(obj);
+    else if (PyInt_Check(obj))
+        d = PyInt_AS_LONG(obj);
 #endif
-        else if (obj == Py_None) {
-            // None stands for default value
-            switch (option) {
-            case LRO_PROXYTYPE:
-                d = LRO_PROXYTYPE_DEFAULT;
-                break;
-            case LRO_LOWSPEEDTIME:
-                d = LRO_LOWSPEEDTIME_DEFAULT;
-                break;
-            case LRO_LOWSPEEDLIMIT:
-                d = LRO_LOWSPEEDLIMIT_DEFAULT;
-                break;
-            case LRO_FASTESTMIRRORMAXAGE:
-                d = LRO_FASTESTMIRRORMAXAGE_DEFAULT;
-                break;
-            case LRO_IPRESOLVE:
-                d = LRO_IPRESOLVE_DEFAULT;
-                break;
-            case LRO_ALLOWEDMIRRORFAILURES:
-                d = LRO_ALLOWEDMIRRORFAILURES_DEFAULT;
-                break;
-            default:
-                badarg = 1;
-            }
-        } else
+    else if (obj == Py_None) {
+        // None stands for default value
+        switch (option) {
+        case LRO_PROXYTYPE:
+            d = LRO_PROXYTYPE_DEFAULT;
+            break;
+        case LRO_LOWSPEEDTIME:
+            d = LRO_LOWSPEEDTIME_DEFAULT;
+            break;
+        case LRO_LOWSPEEDLIMIT:
+            d = LRO_LOWSPEEDLIMIT_DEFAULT;
+            break;
+        case LRO_FASTESTMIRRORMAXAGE:
+            d = LRO_FASTESTMIRRORMAXAGE_DEFAULT;
+            break;
+        case LRO_IPRESOLVE:
+            d = LRO_IPRESOLVE_DEFAULT;
+            break;
+        case LRO_ALLOWEDMIRRORFAILURES:
+            d = LRO_ALLOWEDMIRRORFAILURES_DEFAULT;
+            break;
+        default:
             badarg = 1;
-
-        if (badarg) {
-            PyErr_SetString(PyExc_TypeError, "Only Int/Long is supported with this option");
-            return NULL;
         }
+    } else
+        badarg = 1;
 
-        res = lr_handle_setopt(self->handle,
-                               &tmp_err,
-                               (LrHandleOption)option,
-                               d);
-        break;
+    if (badarg) {
+        PyErr_SetString(PyExc_TypeError, "Only Int/Long is supported with this option");
+        return NULL;
     }
 
-    /*
-     * Options with long/int/None arguments
-     */
-    case LRO_PROXYPORT:
-    case LRO_CONNECTTIMEOUT:
-    case LRO_MAXMIRRORTRIES:
-    case LRO_MAXPARALLELDOWNLOADS:
-    case LRO_MAXDOWNLOADSPERMIRROR:
-    {
-        long d;
+    res = lr_handle_setopt(self->handle, &tmp_err, option, d);
+    return setopt_result(res, &tmp_err);
+}
 
-        if (PyLong_Check(obj))
-            d = PyLong_AsLong(obj);
+/*
+ * Options with long/int/None arguments
+ */
+static PyObject *
+setopt_long_none(_HandleObject *self, LrHandleOption option, PyObject *obj)
+{
+    gboolean res;
+    GError *tmp_err = NULL;
+    long d;
+
+    if (PyLong_Check(obj))
+        d = PyLong_AsLong(obj);
 #if PY_MAJOR_VERSION < 3
-        else if (PyInt_Check(obj))
-            d = PyInt_AS_LONG(obj);
+    else if (PyInt_Check(obj))
+        d = PyInt_AS_LONG(obj);
 #endif
-        else if (obj == Py_None) {
-            /* Default options */
-            if (option == LRO_PROXYPORT)
-                d = LRO_PROXYPORT_DEFAULT;
-            else if (option == LRO_MAXMIRRORTRIES)
-                d = LRO_MAXMIRRORTRIES_DEFAULT;
-            else if (option == LRO_CONNECTTIMEOUT)
-                d = LRO_CONNECTTIMEOUT_DEFAULT;
-            else if (option == LRO_MAXPARALLELDOWNLOADS)
-                d = LRO_MAXPARALLELDOWNLOADS_DEFAULT;
-            else if (option == LRO_MAXDOWNLOADSPERMIRROR)
-                d = LRO_MAXDOWNLOADSPERMIRROR_DEFAULT;
-            else
-                assert(0);
-        } else {
-            PyErr_SetString(PyExc_TypeError, "Only Int/Long/None is supported with this option");
-            return NULL;
-        }
-
-        res = lr_handle_setopt(self->handle,
-                               &tmp_err,
-                               (LrHandleOption)option,
-                               d);
-        break;
+    else if (obj == Py_None) {
+        /* Default options */
+        if (option == LRO_PROXYPORT)
+            d = LRO_PROXYPORT_DEFAULT;
+        else if (option == LRO_MAXMIRRORTRIES)
+            d = LRO_MAXMIRRORTRIES_DEFAULT;
+        else if (option == LRO_CONNECTTIMEOUT)
+            d = LRO_CONNECTTIMEOUT_DEFAULT;
+        else if (option == LRO_MAXPARALLELDOWNLOADS)
+            d = LRO_MAXPARALLELDOWNLOADS_DEFAULT;
+        else if (option == LRO_MAXDOWNLOADSPERMIRROR)
+            d = LRO_MAXDOWNLOADSPERMIRROR_DEFAULT;
+        else
+            assert(0);
+    } else {
+        PyErr_SetString(PyExc_TypeError, "Only Int/Long/None is supported with this option");
+        return NULL;
     }
 
-    /*
-     * Options with gint64/None arguments
-     */
-    case LRO_MAXSPEED:
-    {
-        gint64 d;
+    res = lr_handle_setopt(self->handle, &tmp_err, option, d);
+    return setopt_result(res, &tmp_err);
+}
 
-        if (PyLong_Check(obj))
-            d = (gint64) PyLong_AsLongLong(obj);
+/*
+ * Options with gint64/None arguments
+ */
+static PyObject *
+setopt_gint64(_HandleObject *self, LrHandleOption option, PyObject *obj)
+{
+    gboolean res;
+    GError *tmp_err = NULL;
+    gint64 d;
+
+    if (PyLong_Check(obj))
+        d = (gint64) PyLong_AsLongLong(obj);
 #if PY_MAJOR_VERSION < 3
-        else if (PyInt_Check(obj))
-            d = (gint64) PyInt_AS_LONG(obj);
+    else if (PyInt_Check(obj))
+        d = (gint64) PyInt_AS_LONG(obj);
 #endif
-        else if (obj == Py_None) {
-            /* Default options */
-            if (option == LRO_MAXSPEED)
-                d = (gint64) LRO_MAXSPEED_DEFAULT;
-            else
-                assert(0);
-        } else {
-            PyErr_SetString(PyExc_TypeError, "Only Int/Long/None is supported with this option");
+    else if (obj == Py_None) {
+        /* Default options */
+        if (option == LRO_MAXSPEED)
+            d = (gint64) LRO_MAXSPEED_DEFAULT;
+        else
+            assert(0);
+    } else {
+        PyErr_SetString(PyExc_TypeError, "Only Int/Long/None is supported with this option");
+        return NULL;
+    }
+
+    res = lr_handle_setopt(self->handle, &tmp_err, option, d);
+    return setopt_result(res, &tmp_err);
+}
+
+/*
+ * Options with array argument
+ */
+static PyObject *
+setopt_strlist(_HandleObject *self, LrHandleOption option, PyObject *obj)
+{
+    gboolean res;
+    GError *tmp_err = NULL;
+    Py_ssize_t len = 0;
+
+    if (option == LRO_URLS && !PyList_Check(obj) && obj != Py_None) {
+        char *urls[2] = { NULL, NULL };
+        PyObject *bytes = NULL;
+
+        if (PyErr_WarnEx(PyExc_DeprecationWarning,
+                         "Using string value for LRO_URLS is deprecated, "
+                         "use list of strings instead", 1) < 0)
+            return NULL;
+
+        if (!PyBytes_Check(obj) && !PyUnicode_Check(obj)) {
+            PyErr_SetString(PyExc_TypeError, "Only strings or Nones are supported in list");
             return NULL;
         }
 
-        res = lr_handle_setopt(self->handle,
-                               &tmp_err,
-                               (LrHandleOption)option,
-                               d);
-        break;
+        // Single URL is passed directly, no list is needed
+        if (PyUnicode_Check(obj)) {
+            bytes = PyUnicode_AsUTF8String(obj);
+            if (!bytes)
+                return NULL;
+            urls[0] = PyBytes_AsString(bytes);
+        } else {
+            urls[0] = PyBytes_AsString(obj);
+        }
+
+        res = lr_handle_setopt(self->handle, &tmp_err, option, urls);
+        Py_XDECREF(bytes);
+        return setopt_result(res, &tmp_err);
     }
 
-    /*
-     * Options with array argument
-     */
-    case LRO_URLS:
-    case LRO_YUMDLIST:
-    case LRO_YUMBLIST: {
-        Py_ssize_t len = 0;
+    if (!PyList_Check(obj) && obj != Py_None) {
+        PyErr_SetString(PyExc_TypeError, "Only List or None type is supported with this option");
+        return NULL;
+    }
 
-        if (!PyList_Check(obj) && obj != Py_None) {
-            PyErr_SetString(PyExc_TypeError, "Only List or None type is supported with this option");
+    if (obj == Py_None) {
+        res = lr_handle_setopt(self->handle, &tmp_err, option, NULL);
+        return setopt_result(res, &tmp_err);
+    }
+
+    len = PyList_GET_SIZE(obj);
+    for (Py_ssize_t x = 0; x < len; x++) {
+        PyObject *item = PyList_GET_ITEM(obj, x);
+        if (!PyBytes_Check(item) && !PyUnicode_Check(item) && item != Py_None) {
+            PyErr_SetString(PyExc_TypeError, "Only strings or Nones are supported in list");
             return NULL;
         }
+    }
 
-        if (obj == Py_None) {
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   (LrHandleOption)option,
-                                   NULL);
-            break;
-        }
+    GStringChunk *chunk = g_string_chunk_new(0);
+    GPtrArray *ptrarray = g_ptr_array_sized_new(len + 1);
+    for (Py_ssize_t x = 0; x < len; x++) {
+        PyObject *item = PyList_GET_ITEM(obj, x);
 
-        len = PyList_Size(obj);
-        for (Py_ssize_t x = 0; x < len; x++) {
-            PyObject *item = PyList_GetItem(obj, x);
-            if (!PyBytes_Check(item) && !PyUnicode_Check(item) && item != Py_None) {
-                PyErr_SetString(PyExc_TypeError, "Only strings or Nones are supported in list");
+        if (PyUnicode_Check(item)) {
+            PyObject *bytes = PyUnicode_AsUTF8String(item);
+            if (!bytes) {
+                g_ptr_array_free(ptrarray, TRUE);
+                g_string_chunk_free(chunk);
                 return NULL;
             }
+            char *item_str = g_string_chunk_insert(chunk,
+                                                PyBytes_AsString(bytes));
+            Py_XDECREF(bytes);
+            g_ptr_array_add(ptrarray, item_str);
         }
 
-        GStringChunk *chunk = g_string_chunk_new(0);
-        GPtrArray *ptrarray = g_ptr_array_sized_new(len + 1);
-        for (Py_ssize_t x = 0; x < len; x++) {
-            PyObject *item = PyList_GetItem(obj, x);
-
-            if (PyUnicode_Check(item)) {
-                PyObject *bytes = PyUnicode_AsUTF8String(item);
-                if (!bytes) {
-                    g_ptr_array_free(ptrarray, TRUE);
-                    g_string_chunk_free(chunk);
-                    return NULL;
-                }
-                char *item_str = g_string_chunk_insert(chunk,
-                                                    PyBytes_AsString(bytes));
-                Py_XDECREF(bytes);
-                g_ptr_array_add(ptrarray, item_str);
-            }
+        if (PyBytes_Check(item))
+            g_ptr_array_add(ptrarray, PyBytes_AsString(item));
+    }
+    g_ptr_array_add(ptrarray, NULL);
 
-            if (PyBytes_Check(item))
-                g_ptr_array_add(ptrarray, PyBytes_AsString(item));
-        }
-        g_ptr_array_add(ptrarray, NULL);
-
-        res = lr_handle_setopt(self->handle,
-                               &tmp_err,
-                               (LrHandleOption)option,
-                               ptrarray->pdata);
-        g_string_chunk_free(chunk);
-        g_ptr_array_free(ptrarray, TRUE);
-        break;
+    res = lr_handle_setopt(self->handle, &tmp_err, option, ptrarray->pdata);
+    g_string_chunk_free(chunk);
+    g_ptr_array_free(ptrarray, TRUE);
+    return setopt_result(res, &tmp_err);
+}
+
+static PyObject *
+setopt_varsub(_HandleObject *self, LrHandleOption option, PyObject *obj)
+{
+    gboolean res;
+    GError *tmp_err = NULL;
+    Py_ssize_t len = 0;
+    LrUrlVars *vars = NULL;
+
+    if (!PyList_Check(obj) && obj != Py_None) {
+        PyErr_SetString(PyExc_TypeError, "Only List of tuples or None type is supported with this option");
+        return NULL;
     }
 
-    case LRO_VARSUB: {
-        Py_ssize_t len = 0;
-        LrUrlVars *vars = NULL;
+    if (obj == Py_None) {
+        res = lr_handle_setopt(self->handle, &tmp_err, option, NULL);
+        return setopt_result(res, &tmp_err);
+    }
+
+    // Check all list elements
+    len = PyList_GET_SIZE(obj);
+    for (Py_ssize_t x = 0; x < len; x++) {
+        PyObject *item = PyList_GET_ITEM(obj, x);
+        PyObject *tuple_item;
 
-        if (!PyList_Check(obj) && obj != Py_None) {
-            PyErr_SetString(PyExc_TypeError, "Only List of tuples or None type is supported with this option");
+        if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
+            PyErr_SetString(PyExc_TypeError, "List elements has to be "
+                "tuples with exactly 2 elements");
             return NULL;
         }
 
-        if (obj == Py_None) {
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   (LrHandleOption)option,
-                                   NULL);
-            break;
+        tuple_item = PyTuple_GET_ITEM(item, 1);
+        if ((!PyBytes_Check(PyTuple_GET_ITEM(item, 0))
+            && !PyUnicode_Check(PyTuple_GET_ITEM(item, 0))) ||
+            (!PyBytes_Check(tuple_item)
+             && !PyUnicode_Check(tuple_item)
+             && tuple_item != Py_None))
+        {
+            PyErr_SetString(PyExc_TypeError, "Bad list format");
+            return NULL;
         }
+    }
 
-        // Check all list elements
-        len = PyList_Size(obj);
-        for (Py_ssize_t x = 0; x < len; x++) {
-            PyObject *item = PyList_GetItem(obj, x);
-            PyObject *tuple_item;
+    GStringChunk *chunk = g_string_chunk_new(0);
+    for (Py_ssize_t x = 0; x < len; x++) {
+        PyObject *item = PyList_GET_ITEM(obj, x);
+        PyObject *tuple_item;
+        char *var, *val;
 
-            if (!PyTuple_Check(item) || PyTuple_Size(item) != 2) {
-                PyErr_SetString(PyExc_TypeError, "List elements has to be "
-                    "tuples with exactly 2 elements");
+        tuple_item = PyTuple_GET_ITEM(item, 0);
+        if (PyBytes_Check(tuple_item)) {
+            // PyBytes
+            var = PyBytes_AsString(tuple_item);
+        } else {
+            // PyUnicode
+            PyObject *bytes = PyUnicode_AsUTF8String(tuple_item);
+            if (!bytes) {
+                lr_urlvars_free(vars);
+                g_string_chunk_free(chunk);
                 return NULL;
             }
+            char *item_str = g_string_chunk_insert(chunk,
+                                                PyBytes_AsString(bytes));
+            Py_XDECREF(bytes);
+            var = item_str;
+        }
 
-            tuple_item = PyTuple_GetItem(item, 1);
-            if ((!PyBytes_Check(PyTuple_GetItem(item, 0))
-                && !PyUnicode_Check(PyTuple_GetItem(item, 0))) ||
-                (!PyBytes_Check(tuple_item)
-                 && !PyUnicode_Check(tuple_item)
-                 && tuple_item != Py_None))
-            {
-                PyErr_SetString(PyExc_TypeError, "Bad list format");
+        tuple_item = PyTuple_GET_ITEM(item, 1);
+        if (tuple_item == Py_None) {
+            // Py_None
+            val = NULL;
+        } else if (PyBytes_Check(tuple_item)) {
+            // PyBytes
+            val = PyBytes_AsString(tuple_item);
+        } else {
+            // PyUnicode
+            PyObject *bytes = PyUnicode_AsUTF8String(tuple_item);
+            if (!bytes) {
+                lr_urlvars_free(vars);
+                g_string_chunk_free(chunk);
                 return NULL;
             }
+            char *item_str = g_string_chunk_insert(chunk,
+                                                PyBytes_AsString(bytes));
+            Py_XDECREF(bytes);
+            val = item_str;
         }
 
-        GStringChunk *chunk = g_string_chunk_new(0);
-        for (Py_ssize_t x = 0; x < len; x++) {
-            PyObject *item = PyList_GetItem(obj, x);
-            PyObject *tuple_item;
-            char *var, *val;
-
-            tuple_item = PyTuple_GetItem(item, 0);
-            if (PyBytes_Check(tuple_item)) {
-                // PyBytes
-                var = PyBytes_AsString(tuple_item);
-            } else {
-                // PyUnicode
-                PyObject *bytes = PyUnicode_AsUTF8String(tuple_item);
-                if (!bytes) {
-                    lr_urlvars_free(vars);
-                    g_string_chunk_free(chunk);
-                    return NULL;
-                }
-                char *item_str = g_string_chunk_insert(chunk,
-                                                    PyBytes_AsString(bytes));
-                Py_XDECREF(bytes);
-                var = item_str;
-            }
+        vars = lr_urlvars_set(vars, var, val);
+    }
 
-            tuple_item = PyTuple_GetItem(item, 1);
-            if (tuple_item == Py_None) {
-                // Py_None
-                val = NULL;
-            } else if (PyBytes_Check(tuple_item)) {
-                // PyBytes
-                val = PyBytes_AsString(tuple_item);
-            } else {
-                // PyUnicode
-                PyObject *bytes = PyUnicode_AsUTF8String(tuple_item);
-                if (!bytes) {
-                    lr_urlvars_free(vars);
-                    g_string_chunk_free(chunk);
-                    return NULL;
-                }
-                char *item_str = g_string_chunk_insert(chunk,
-                                                    PyBytes_AsString(bytes));
-                Py_XDECREF(bytes);
-                val = item_str;
-            }
+    res = lr_handle_setopt(self->handle, &tmp_err, option, vars);
+    g_string_chunk_free(chunk);
+    return setopt_result(res, &tmp_err);
+}
 
-            vars = lr_urlvars_set(vars, var, val);
-        }
+/*
+ * Options with callable arguments
+ */
 
-        res = lr_handle_setopt(self->handle,
-                               &tmp_err,
-                               (LrHandleOption)option,
-                               vars);
-        g_string_chunk_free(chunk);
-        break;
+/* Replace the stored python callback, None removes it */
+static int
+store_callback(PyObject **cb, PyObject *obj)
+{
+    if (!PyCallable_Check(obj) && obj != Py_None) {
+        PyErr_SetString(PyExc_TypeError, "Only callable argument or None is supported with this option");
+        return -1;
     }
 
-    /*
-     * Options with callable arguments
-     */
-    case LRO_PROGRESSCB: {
-        if (!PyCallable_Check(obj) && obj != Py_None) {
-            PyErr_SetString(PyExc_TypeError, "Only callable argument or None is supported with this option");
-            return NULL;
-        }
-
-        Py_XDECREF(self->progress_cb);
-        if (obj == Py_None) {
-            // None object
-            self->progress_cb = NULL;
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   (LrHandleOption)option,
-                                   NULL);
-            if (!res)
-                RETURN_ERROR(&tmp_err, -1, NULL);
-        } else {
-            // New callback object
-            Py_XINCREF(obj);
-            self->progress_cb = obj;
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   (LrHandleOption)option,
-                                   progress_callback);
-            if (!res)
-                RETURN_ERROR(&tmp_err, -1, NULL);
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   LRO_PROGRESSDATA,
-                                   self);
-        }
-        break;
+    Py_XDECREF(*cb);
+    if (obj == Py_None) {
+        // None object
+        *cb = NULL;
+    } else {
+        // New callback object
+        Py_XINCREF(obj);
+        *cb = obj;
     }
+    return 0;
+}
 
-    case LRO_FASTESTMIRRORCB: {
-        if (!PyCallable_Check(obj) && obj != Py_None) {
-            PyErr_SetString(PyExc_TypeError, "Only callable argument or None is supported with this option");
-            return NULL;
-        }
+static PyObject *
+setopt_progresscb(_HandleObject *self, LrHandleOption option, PyObject *obj)
+{
+    gboolean res;
+    GError *tmp_err = NULL;
 
-        Py_XDECREF(self->fastestmirror_cb);
-        if (obj == Py_None) {
-            // None object
-            self->fastestmirror_cb = NULL;
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   (LrHandleOption)option,
-                                   NULL);
-            if (!res)
-                RETURN_ERROR(&tmp_err, -1, NULL);
-        } else {
-            // New callback object
-            Py_XINCREF(obj);
-            self->fastestmirror_cb = obj;
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   (LrHandleOption)option,
-                                   fastestmirror_callback);
-            if (!res)
-                RETURN_ERROR(&tmp_err, -1, NULL);
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   LRO_FASTESTMIRRORDATA,
-                                   self);
-        }
-        break;
+    if (store_callback(&self->progress_cb, obj))
+        return NULL;
+
+    if (!self->progress_cb) {
+        res = lr_handle_setopt(self->handle, &tmp_err, option, NULL);
+    } else {
+        res = lr_handle_setopt(self->handle, &tmp_err, option,
+                               progress_callback);
+        if (res)
+            res = lr_handle_setopt(self->handle, &tmp_err,
+                                   LRO_PROGRESSDATA, self);
     }
+    return setopt_result(res, &tmp_err);
+}
 
-    case LRO_HMFCB: {
-        if (!PyCallable_Check(obj) && obj != Py_None) {
-            PyErr_SetString(PyExc_TypeError, "Only callable argument or None is supported with this option");
-            return NULL;
-        }
+static PyObject *
+setopt_fastestmirrorcb(_HandleObject *self, LrHandleOption option, PyObject *obj)
+{
+    gboolean res;
+    GError *tmp_err = NULL;
 
-        Py_XDECREF(self->hmf_cb);
-        if (obj == Py_None) {
-            // None object
-            self->hmf_cb = NULL;
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   (LrHandleOption)option,
-                                   NULL);
-            if (!res)
-                RETURN_ERROR(&tmp_err, -1, NULL);
-        } else {
-            // New callback object
-            Py_XINCREF(obj);
-            self->hmf_cb = obj;
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   (LrHandleOption)option,
-                                   hmf_callback);
-            if (!res)
-                RETURN_ERROR(&tmp_err, -1, NULL);
-            res = lr_handle_setopt(self->handle,
-                                   &tmp_err,
-                                   LRO_PROGRESSDATA,
-                                   self);
-        }
-        break;
+    if (store_callback(&self->fastestmirror_cb, obj))
+        return NULL;
+
+    if (!self->fastestmirror_cb) {
+        res = lr_handle_setopt(self->handle, &tmp_err, option, NULL);
+    } else {
+        res = lr_handle_setopt(self->handle, &tmp_err, option,
+                               fastestmirror_callback);
+        if (res)
+            res = lr_handle_setopt(self->handle, &tmp_err,
+                                   LRO_FASTESTMIRRORDATA, self);
     }
+    return setopt_result(res, &tmp_err);
+}
 
+static PyObject *
+setopt_hmfcb(_HandleObject *self, LrHandleOption option, PyObject *obj)
+{
+    gboolean res;
+    GError *tmp_err = NULL;
 
-    /*
-     * Options with callback data
-     */
-    case LRO_PROGRESSDATA: {
-        if (obj == Py_None) {
-            self->progress_cb_data = NULL;
-        } else {
-            Py_XINCREF(obj);
-            self->progress_cb_data = obj;
-        }
-        break;
+    if (store_callback(&self->hmf_cb, obj))
+        return NULL;
+
+    if (!self->hmf_cb) {
+        res = lr_handle_setopt(self->handle, &tmp_err, option, NULL);
+    } else {
+        res = lr_handle_setopt(self->handle, &tmp_err, option,
+                               hmf_callback);
+        if (res)
+            res = lr_handle_setopt(self->handle, &tmp_err,
+                                   LRO_PROGRESSDATA, self);
     }
+    return setopt_result(res, &tmp_err);
+}
 
-    case LRO_FASTESTMIRRORDATA: {
-        if (obj == Py_None) {
-            self->fastestmirror_cb_data = NULL;
-        } else {
-            Py_XINCREF(obj);
-            self->fastestmirror_cb_data = obj;
-        }
-        break;
+/*
+ * Options with callback data
+ */
+static PyObject *
+setopt_progressdata(_HandleObject *self,
+                    G_GNUC_UNUSED LrHandleOption option,
+                    PyObject *obj)
+{
+    if (obj == Py_None) {
+        self->progress_cb_data = NULL;
+    } else {
+        Py_XINCREF(obj);
+        self->progress_cb_data = obj;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+setopt_fastestmirrordata(_HandleObject *self,
+                         G_GNUC_UNUSED LrHandleOption option,
+                         PyObject *obj)
+{
+    if (obj == Py_None) {
+        self->fastestmirror_cb_data = NULL;
+    } else {
+        Py_XINCREF(obj);
+        self->fastestmirror_cb_data = obj;
     }
+    Py_RETURN_NONE;
+}
+
+static const SetoptHandler setopt_handlers[] = {
+    [LRO_UPDATE]                = setopt_bool,
+    [LRO_URLS]                  = setopt_strlist,
+    [LRO_MIRRORLIST]            = setopt_string,
+    [LRO_MIRRORLISTURL]         = setopt_string,
+    [LRO_METALINKURL]           = setopt_string,
+    [LRO_LOCAL]                 = setopt_bool,
+    [LRO_HTTPAUTH]              = setopt_bool,
+    [LRO_USERPWD]               = setopt_string,
+    [LRO_PROXY]                 = setopt_string,
+    [LRO_PROXYPORT]             = setopt_long_none,
+    [LRO_PROXYTYPE]             = setopt_long,
+    [LRO_PROXYAUTH]             = setopt_bool,
+    [LRO_PROXYUSERPWD]          = setopt_string,
+    [LRO_PROGRESSCB]            = setopt_progresscb,
+    [LRO_PROGRESSDATA]          = setopt_progressdata,
+    [LRO_MAXSPEED]              = setopt_gint64,
+    [LRO_DESTDIR]               = setopt_string,
+    [LRO_REPOTYPE]              = setopt_long,
+    [LRO_CONNECTTIMEOUT]        = setopt_long_none,
+    [LRO_IGNOREMISSING]         = setopt_bool,
+    [LRO_INTERRUPTIBLE]         = setopt_bool,
+    [LRO_USERAGENT]             = setopt_string,
+    [LRO_FETCHMIRRORS]          = setopt_bool,
+    [LRO_MAXMIRRORTRIES]        = setopt_long_none,
+    [LRO_MAXPARALLELDOWNLOADS]  = setopt_long_none,
+    [LRO_MAXDOWNLOADSPERMIRROR] = setopt_long_none,
+    [LRO_VARSUB]                = setopt_varsub,
+    [LRO_FASTESTMIRROR]         = setopt_bool,
+    [LRO_FASTESTMIRRORCACHE]    = setopt_string,
+    [LRO_FASTESTMIRRORMAXAGE]   = setopt_long,
+    [LRO_FASTESTMIRRORCB]       = setopt_fastestmirrorcb,
+    [LRO_FASTESTMIRRORDATA]     = setopt_fastestmirrordata,
+    [LRO_LOWSPEEDTIME]          = setopt_long,
+    [LRO_LOWSPEEDLIMIT]         = setopt_long,
+    [LRO_GPGCHECK]              = setopt_bool,
+    [LRO_CHECKSUM]              = setopt_bool,
+    [LRO_YUMDLIST]              = setopt_strlist,
+    [LRO_YUMBLIST]              = setopt_strlist,
+    [LRO_HMFCB]                 = setopt_hmfcb,
+    [LRO_SSLVERIFYPEER]         = setopt_bool,
+    [LRO_SSLVERIFYHOST]         = setopt_bool,
+    [LRO_IPRESOLVE]             = setopt_long,
+    [LRO_ALLOWEDMIRRORFAILURES] = setopt_long,
+    [LRO_ADAPTIVEMIRRORSORTING] = setopt_bool,
+    [LRO_GNUPGHOMEDIR]          = setopt_string,
+};
+
+G_STATIC_ASSERT(G_N_ELEMENTS(setopt_handlers) == LRO_SENTINEL);
 
-    /*
-     * Unknown options
-     */
-    default:
+static PyObject *
+setopt_option(_HandleObject *self, long option, PyObject *obj)
+{
+    if (check_HandleStatus(self))
+        return NULL;
+
+    if (option < 0 || option >= LRO_SENTINEL || !setopt_handlers[option]) {
         PyErr_SetString(PyExc_TypeError, "Unknown option");
         return NULL;
     }
 
-    if (!res)
-        RETURN_ERROR(&tmp_err, -1, NULL);
-    Py_RETURN_NONE;
+    return setopt_handlers[option](self, (LrHandleOption) option, obj);
 }
 
+/* setopt_option() returning 0 on success and -1 on error */
+static int
+set_one_option(_HandleObject *self, long option, PyObject *value)
+{
+    PyObject *ret;
+
+    // Handlers may run python code (warnings), which could drop the last
+    // reference of a value borrowed from a dict, keep the value alive
+    Py_INCREF(value);
+    ret = setopt_option(self, option, value);
+    Py_DECREF(value);
+    if (!ret)
+        return -1;
+    Py_DECREF(ret);
+    return 0;
+}
+
+/* char** options */
 static PyObject *
-py_getinfo(_HandleObject *self, PyObject *args)
+getinfo_string(_HandleObject *self, LrHandleInfoOption option)
 {
-    int option;
-    gboolean res = TRUE;
+    GError *tmp_err = NULL;
     char *str;
-    long lval;
+
+    if (!lr_handle_getinfo(self->handle, &tmp_err, option, &str))
+        RETURN_ERROR(&tmp_err, -1, NULL);
+    return PyStringOrNone_FromString(str);
+}
+
+/* long* options */
+static PyObject *
+getinfo_long(_HandleObject *self, LrHandleInfoOption option)
+{
     GError *tmp_err = NULL;
+    long lval;
 
-    if (!PyArg_ParseTuple(args, "i:py_getinfo", &option))
-        return NULL;
-    if (check_HandleStatus(self))
-        return NULL;
+    if (!lr_handle_getinfo(self->handle, &tmp_err, option, &lval))
+        RETURN_ERROR(&tmp_err, -1, NULL);
+    return PyLong_FromLong(lval);
+}
 
-    switch (option) {
-
-    /* char** options */
-    case LRI_MIRRORLIST:
-    case LRI_MIRRORLISTURL:
-    case LRI_METALINKURL:
-    case LRI_DESTDIR:
-    case LRI_USERAGENT:
-    case LRI_FASTESTMIRRORCACHE:
-    case LRI_GNUPGHOMEDIR:
-        res = lr_handle_getinfo(self->handle,
-                                &tmp_err,
-                                (LrHandleInfoOption)option,
-                                &str);
-        if (!res)
-            RETURN_ERROR(&tmp_err, -1, NULL);
-        return PyStringOrNone_FromString(str);
-
-    /* long* options */
-    case LRI_UPDATE:
-    case LRI_LOCAL:
-    case LRI_REPOTYPE:
-    case LRI_FETCHMIRRORS:
-    case LRI_MAXMIRRORTRIES:
-    case LRI_FASTESTMIRROR:
-    case LRI_FASTESTMIRRORMAXAGE:
-    case LRI_SSLVERIFYPEER:
-    case LRI_SSLVERIFYHOST:
-    case LRI_ALLOWEDMIRRORFAILURES:
-    case LRI_ADAPTIVEMIRRORSORTING:
-        res = lr_handle_getinfo(self->handle,
-                                &tmp_err,
-                                (LrHandleInfoOption)option,
-                                &lval);
-        if (!res)
-            RETURN_ERROR(&tmp_err, -1, NULL);
-        return PyLong_FromLong(lval);
-
-    /* LrIpResolveType* option  */
-    case LRI_IPRESOLVE: {
-        LrIpResolveType type;
-        res = lr_handle_getinfo(self->handle,
-                                &tmp_err,
-                                (LrHandleInfoOption)option,
-                                &type);
-        if (!res)
-            RETURN_ERROR(&tmp_err, -1, NULL);
-        return PyLong_FromLong((long) type);
-    }
+/* LrIpResolveType* option  */
+static PyObject *
+getinfo_ipresolve(_HandleObject *self, LrHandleInfoOption option)
+{
+    GError *tmp_err = NULL;
+    LrIpResolveType type;
 
-    /* List option */
-    case LRI_VARSUB: {
-        LrUrlVars *vars;
-        PyObject *list;
+    if (!lr_handle_getinfo(self->handle, &tmp_err, option, &type))
+        RETURN_ERROR(&tmp_err, -1, NULL);
+    return PyLong_FromLong((long) type);
+}
 
-        res = lr_handle_getinfo(self->handle,
-                                &tmp_err,
-                                (LrHandleInfoOption)option,
-                                &vars);
-        if (!res)
-            RETURN_ERROR(&tmp_err, -1, NULL);
+/* List option */
+static PyObject *
+getinfo_varsub(_HandleObject *self, LrHandleInfoOption option)
+{
+    GError *tmp_err = NULL;
+    LrUrlVars *vars;
+    PyObject *list;
 
-        if (vars == NULL)
-            Py_RETURN_NONE;
+    if (!lr_handle_getinfo(self->handle, &tmp_err, option, &vars))
+        RETURN_ERROR(&tmp_err, -1, NULL);
 
-        list = PyList_New(0);
-        for (LrUrlVars *elem = vars; elem; elem = g_slist_next(elem)) {
-            PyObject *tuple, *obj;
-            LrVar *var = elem->data;
+    if (vars == NULL)
+        Py_RETURN_NONE;
 
-            tuple = PyTuple_New(2);
-            obj = PyStringOrNone_FromString(var->var);
-            PyTuple_SetItem(tuple, 0, obj);
+    list = PyList_New(g_slist_length(vars));
+    if (!list)
+        return NULL;
 
-            if (var->val != NULL) {
-                obj = PyStringOrNone_FromString(var->val);
-            } else {
-                Py_INCREF(Py_None);
-                obj = Py_None;
-            }
+    Py_ssize_t x = 0;
+    for (LrUrlVars *elem = vars; elem; elem = g_slist_next(elem), x++) {
+        PyObject *tuple, *obj;
+        LrVar *var = elem->data;
 
-            PyTuple_SetItem(tuple, 1, obj);
+        tuple = PyTuple_New(2);
+        if (!tuple) {
+            Py_DECREF(list);
+            return NULL;
+        }
+        // The list owns the tuple from now
+        PyList_SET_ITEM(list, x, tuple);
 
-            PyList_Append(list, tuple);
+        obj = PyStringOrNone_FromString(var->var);
+        if (!obj) {
+            Py_DECREF(list);
+            return NULL;
         }
-        return list;
+        PyTuple_SET_ITEM(tuple, 0, obj);
+
+        // None for variables without a value
+        obj = PyStringOrNone_FromString(var->val);
+        if (!obj) {
+            Py_DECREF(list);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(tuple, 1, obj);
     }
+    return list;
+}
 
-    /* char*** options */
-    case LRI_URLS:
-    case LRI_YUMDLIST:
-    case LRI_YUMBLIST:
-    case LRI_MIRRORS: {
-        PyObject *list;
-        char **strlist;
-        res = lr_handle_getinfo(self->handle,
-                                &tmp_err,
-                                (LrHandleInfoOption)option,
-                                &strlist);
-        if (!res)
-            RETURN_ERROR(&tmp_err, -1, NULL);
-        if (strlist == NULL) {
-            if (option == LRI_MIRRORS || option == LRI_URLS) {
-                return PyList_New(0);
-            } else {
-                Py_RETURN_NONE;
-            }
+/* char*** options */
+static PyObject *
+getinfo_strlist(_HandleObject *self, LrHandleInfoOption option)
+{
+    GError *tmp_err = NULL;
+    PyObject *list;
+    char **strlist;
+
+    if (!lr_handle_getinfo(self->handle, &tmp_err, option, &strlist))
+        RETURN_ERROR(&tmp_err, -1, NULL);
+    if (strlist == NULL) {
+        if (option == LRI_MIRRORS || option == LRI_URLS) {
+            return PyList_New(0);
+        } else {
+            Py_RETURN_NONE;
         }
-        list = PyList_New(0);
-        for (int x=0; strlist[x] != NULL; x++) {
-            PyList_Append(list, PyStringOrNone_FromString(strlist[x]));
+    }
+    list = PyList_New(g_strv_length(strlist));
+    for (int x=0; list && strlist[x] != NULL; x++) {
+        PyObject *item = PyStringOrNone_FromString(strlist[x]);
+        if (!item) {
+            Py_CLEAR(list);
+            break;
         }
+        PyList_SET_ITEM(list, x, item);
+    }
 
-        g_strfreev(strlist);
+    g_strfreev(strlist);
 
-        return list;
+    return list;
+}
+
+/* Return a new reference to a stored callback (or its data) or None */
+static PyObject *
+getinfo_pyobject(PyObject *obj)
+{
+    if (obj == NULL)
+        Py_RETURN_NONE;
+    Py_INCREF(obj);
+    return obj;
+}
+
+/* callback option */
+static PyObject *
+getinfo_progresscb(_HandleObject *self, G_GNUC_UNUSED LrHandleInfoOption option)
+{
+    return getinfo_pyobject(self->progress_cb);
+}
+
+/* callback data options */
+static PyObject *
+getinfo_progressdata(_HandleObject *self, G_GNUC_UNUSED LrHandleInfoOption option)
+{
+    return getinfo_pyobject(self->progress_cb_data);
+}
+
+static PyObject *
+getinfo_hmfcb(_HandleObject *self, G_GNUC_UNUSED LrHandleInfoOption option)
+{
+    return getinfo_pyobject(self->hmf_cb);
+}
+
+/* metalink */
+static PyObject *
+getinfo_metalink(_HandleObject *self, LrHandleInfoOption option)
+{
+    GError *tmp_err = NULL;
+    LrMetalink *metalink;
+
+    if (!lr_handle_getinfo(self->handle, &tmp_err, option, &metalink))
+        RETURN_ERROR(&tmp_err, -1, NULL);
+    if (metalink == NULL)
+        Py_RETURN_NONE;
+    return PyObject_FromMetalink(metalink);
+}
+
+static const GetinfoHandler getinfo_handlers[] = {
+    [LRI_UPDATE]                = getinfo_long,
+    [LRI_URLS]                  = getinfo_strlist,
+    [LRI_MIRRORLIST]            = getinfo_string,
+    [LRI_MIRRORLISTURL]         = getinfo_string,
+    [LRI_METALINKURL]           = getinfo_string,
+    [LRI_LOCAL]                 = getinfo_long,
+    [LRI_PROGRESSCB]            = getinfo_progresscb,
+    [LRI_PROGRESSDATA]          = getinfo_progressdata,
+    [LRI_DESTDIR]               = getinfo_string,
+    [LRI_REPOTYPE]              = getinfo_long,
+    [LRI_USERAGENT]             = getinfo_string,
+    [LRI_YUMDLIST]              = getinfo_strlist,
+    [LRI_YUMBLIST]              = getinfo_strlist,
+    [LRI_FETCHMIRRORS]          = getinfo_long,
+    [LRI_MAXMIRRORTRIES]        = getinfo_long,
+    [LRI_VARSUB]                = getinfo_varsub,
+    [LRI_MIRRORS]               = getinfo_strlist,
+    [LRI_METALINK]              = getinfo_metalink,
+    [LRI_FASTESTMIRROR]         = getinfo_long,
+    [LRI_FASTESTMIRRORCACHE]    = getinfo_string,
+    [LRI_FASTESTMIRRORMAXAGE]   = getinfo_long,
+    [LRI_HMFCB]                 = getinfo_hmfcb,
+    [LRI_SSLVERIFYPEER]         = getinfo_long,
+    [LRI_SSLVERIFYHOST]         = getinfo_long,
+    [LRI_IPRESOLVE]             = getinfo_ipresolve,
+    [LRI_ALLOWEDMIRRORFAILURES] = getinfo_long,
+    [LRI_ADAPTIVEMIRRORSORTING] = getinfo_long,
+    [LRI_GNUPGHOMEDIR]          = getinfo_string,
+};
+
+G_STATIC_ASSERT(G_N_ELEMENTS(getinfo_handlers) == LRI_SENTINEL);
+
+static PyObject *
+getinfo_option(_HandleObject *self, long option)
+{
+    if (check_HandleStatus(self))
+        return NULL;
+
+    if (option < 0 || option >= LRI_SENTINEL || !getinfo_handlers[option]) {
+        PyErr_SetString(PyExc_TypeError, "Unknown option");
+        return NULL;
     }
 
-    /* callback option */
-    case LRI_PROGRESSCB:
-        if (self->progress_cb == NULL)
-            Py_RETURN_NONE;
-        Py_INCREF(self->progress_cb);
-        return self->progress_cb;
+    return getinfo_handlers[option](self, (LrHandleInfoOption) option);
+}
 
-    /* callback data options */
-    case LRI_PROGRESSDATA:
-        if (self->progress_cb_data == NULL)
-            Py_RETURN_NONE;
-        Py_INCREF(self->progress_cb_data);
-        return self->progress_cb_data;
+#ifdef HANDLE_USE_FASTCALL
+static PyObject *
+py_setopt(_HandleObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    long option;
 
-    case LRI_HMFCB:
-        if (self->hmf_cb == NULL)
-            Py_RETURN_NONE;
-        Py_INCREF(self->hmf_cb);
-        return self->hmf_cb;
-
-    /* metalink */
-    case LRI_METALINK: {
-        PyObject *py_metalink;
-        LrMetalink *metalink;
-        res = lr_handle_getinfo(self->handle,
-                                &tmp_err,
-                                (LrHandleInfoOption)option,
-                                &metalink);
-        if (!res)
-            RETURN_ERROR(&tmp_err, -1, NULL);
-        if (metalink == NULL)
-            Py_RETURN_NONE;
-        py_metalink = PyObject_FromMetalink(metalink);
-        return py_metalink;
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError,
+                     "py_setopt() takes exactly 2 arguments (%zd given)",
+                     nargs);
+        return NULL;
     }
 
-    default:
-        PyErr_SetString(PyExc_TypeError, "Unknown option");
+    option = PyLong_AsLong(args[0]);
+    if (option == -1 && PyErr_Occurred())
+        return NULL;
+
+    return setopt_option(self, option, args[1]);
+}
+
+static PyObject *
+py_getinfo(_HandleObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    long option;
+
+    if (nargs != 1) {
+        PyErr_Format(PyExc_TypeError,
+                     "py_getinfo() takes exactly one argument (%zd given)",
+                     nargs);
         return NULL;
     }
 
-    assert(res);
+    option = PyLong_AsLong(args[0]);
+    if (option == -1 && PyErr_Occurred())
+        return NULL;
+
+    return getinfo_option(self, option);
+}
+#else
+static PyObject *
+py_setopt(_HandleObject *self, PyObject *args)
+{
+    long option;
+    PyObject *obj;
+
+    if (!PyArg_ParseTuple(args, "lO:py_setopt", &option, &obj))
+        return NULL;
+
+    return setopt_option(self, option, obj);
+}
+
+static PyObject *
+py_getinfo(_HandleObject *self, PyObject *args)
+{
+    long option;
+
+    if (!PyArg_ParseTuple(args, "l:py_getinfo", &option))
+        return NULL;
+
+    return getinfo_option(self, option);
+}
+#endif
+
+static PyObject *
+py_setopts(_HandleObject *self, PyObject *dict)
+{
+    Py_ssize_t pos = 0;
+    PyObject *key, *value;
+
+    if (!PyDict_Check(dict)) {
+        PyErr_SetString(PyExc_TypeError, "Only dict is supported");
+        return NULL;
+    }
+
+    while (PyDict_Next(dict, &pos, &key, &value)) {
+        long option = PyLong_AsLong(key);
+
+        if (option == -1 && PyErr_Occurred())
+            return NULL;
+        if (set_one_option(self, option, value))
+            return NULL;
+    }
+
     Py_RETURN_NONE;
 }
 
@@ -1093,10 +1362,216 @@ py_download_package(_HandleObject *self, PyObject *args)
     }
 }
 
+/* Attributes
+ *
+ * Every option is accessible also as an attribute of the Handle object.
+ * The attribute name is the lowercase option name without the prefix.
+ */
+
+typedef struct {
+    const char *name;   /*!< Name of the attribute */
+    long setopt;        /*!< LRO_* option or -1 if the attribute is read-only */
+    long getinfo;       /*!< LRI_* option or -1 if the attribute is write-only */
+} HandleAttr;
+
+static PyObject *
+get_option_attr(_HandleObject *self, void *closure)
+{
+    const HandleAttr *attr = closure;
+
+    if (attr->getinfo == -1) {
+        PyErr_Format(PyExc_AttributeError,
+                     "Read of attribute '%s' is not supported", attr->name);
+        return NULL;
+    }
+
+    return getinfo_option(self, attr->getinfo);
+}
+
+static int
+set_option_attr(_HandleObject *self, PyObject *value, void *closure)
+{
+    const HandleAttr *attr = closure;
+    PyObject *ret;
+
+    if (attr->setopt == -1) {
+        PyErr_Format(PyExc_AttributeError,
+                     "Set of attribute '%s' is not supported", attr->name);
+        return -1;
+    }
+
+    if (value == NULL) {
+        PyErr_Format(PyExc_AttributeError,
+                     "Attribute '%s' cannot be deleted", attr->name);
+        return -1;
+    }
+
+    ret = setopt_option(self, attr->setopt, value);
+    if (!ret)
+        return -1;
+    Py_DECREF(ret);
+    return 0;
+}
+
+#define HANDLE_ATTR(name, lro, lri) \
+    { name, (getter) get_option_attr, (setter) set_option_attr, NULL, \
+      (void *) &(const HandleAttr) { name, lro, lri } }
+
+static PyGetSetDef handle_getsetters[] = {
+    HANDLE_ATTR("update",                LRO_UPDATE,                LRI_UPDATE),
+    HANDLE_ATTR("urls",                  LRO_URLS,                  LRI_URLS),
+    HANDLE_ATTR("mirrorlist",            LRO_MIRRORLIST,            LRI_MIRRORLIST),
+    HANDLE_ATTR("mirrorlisturl",         LRO_MIRRORLISTURL,         LRI_MIRRORLISTURL),
+    HANDLE_ATTR("metalinkurl",           LRO_METALINKURL,           LRI_METALINKURL),
+    HANDLE_ATTR("local",                 LRO_LOCAL,                 LRI_LOCAL),
+    HANDLE_ATTR("httpauth",              LRO_HTTPAUTH,              -1),
+    HANDLE_ATTR("userpwd",               LRO_USERPWD,               -1),
+    HANDLE_ATTR("proxy",                 LRO_PROXY,                 -1),
+    HANDLE_ATTR("proxyport",             LRO_PROXYPORT,             -1),
+    HANDLE_ATTR("proxytype",             LRO_PROXYTYPE,             -1),
+    HANDLE_ATTR("proxyauth",             LRO_PROXYAUTH,             -1),
+    HANDLE_ATTR("proxyuserpwd",          LRO_PROXYUSERPWD,          -1),
+    HANDLE_ATTR("progresscb",            LRO_PROGRESSCB,            LRI_PROGRESSCB),
+    HANDLE_ATTR("progressdata",          LRO_PROGRESSDATA,          LRI_PROGRESSDATA),
+    HANDLE_ATTR("maxspeed",              LRO_MAXSPEED,              -1),
+    HANDLE_ATTR("destdir",               LRO_DESTDIR,               LRI_DESTDIR),
+    HANDLE_ATTR("repotype",              LRO_REPOTYPE,              LRI_REPOTYPE),
+    HANDLE_ATTR("connecttimeout",        LRO_CONNECTTIMEOUT,        -1),
+    HANDLE_ATTR("ignoremissing",         LRO_IGNOREMISSING,         -1),
+    HANDLE_ATTR("interruptible",         LRO_INTERRUPTIBLE,         -1),
+    HANDLE_ATTR("useragent",             LRO_USERAGENT,             LRI_USERAGENT),
+    HANDLE_ATTR("fetchmirrors",          LRO_FETCHMIRRORS,          LRI_FETCHMIRRORS),
+    HANDLE_ATTR("maxmirrortries",        LRO_MAXMIRRORTRIES,        LRI_MAXMIRRORTRIES),
+    HANDLE_ATTR("maxparalleldownloads",  LRO_MAXPARALLELDOWNLOADS,  -1),
+    HANDLE_ATTR("maxdownloadspermirror", LRO_MAXDOWNLOADSPERMIRROR, -1),
+    HANDLE_ATTR("varsub",                LRO_VARSUB,                LRI_VARSUB),
+    HANDLE_ATTR("fastestmirror",         LRO_FASTESTMIRROR,         LRI_FASTESTMIRROR),
+    HANDLE_ATTR("fastestmirrorcache",    LRO_FASTESTMIRRORCACHE,    LRI_FASTESTMIRRORCACHE),
+    HANDLE_ATTR("fastestmirrormaxage",   LRO_FASTESTMIRRORMAXAGE,   LRI_FASTESTMIRRORMAXAGE),
+    HANDLE_ATTR("fastestmirrorcb",       LRO_FASTESTMIRRORCB,       -1),
+    HANDLE_ATTR("fastestmirrordata",     LRO_FASTESTMIRRORDATA,     -1),
+    HANDLE_ATTR("lowspeedtime",          LRO_LOWSPEEDTIME,          -1),
+    HANDLE_ATTR("lowspeedlimit",         LRO_LOWSPEEDLIMIT,         -1),
+    HANDLE_ATTR("gpgcheck",              LRO_GPGCHECK,              -1),
+    HANDLE_ATTR("checksum",              LRO_CHECKSUM,              -1),
+    HANDLE_ATTR("yumdlist",              LRO_YUMDLIST,              LRI_YUMDLIST),
+    HANDLE_ATTR("yumblist",              LRO_YUMBLIST,              LRI_YUMBLIST),
+    HANDLE_ATTR("hmfcb",                 LRO_HMFCB,                 LRI_HMFCB),
+    HANDLE_ATTR("sslverifypeer",         LRO_SSLVERIFYPEER,         LRI_SSLVERIFYPEER),
+    HANDLE_ATTR("sslverifyhost",         LRO_SSLVERIFYHOST,         LRI_SSLVERIFYHOST),
+    HANDLE_ATTR("ipresolve",             LRO_IPRESOLVE,             LRI_IPRESOLVE),
+    HANDLE_ATTR("allowedmirrorfailures", LRO_ALLOWEDMIRRORFAILURES, LRI_ALLOWEDMIRRORFAILURES),
+    HANDLE_ATTR("adaptivemirrorsorting", LRO_ADAPTIVEMIRRORSORTING, LRI_ADAPTIVEMIRRORSORTING),
+    HANDLE_ATTR("gnupghomedir",          LRO_GNUPGHOMEDIR,          LRI_GNUPGHOMEDIR),
+    HANDLE_ATTR("mirrors",               -1,                        LRI_MIRRORS),
+    HANDLE_ATTR("metalink",              -1,                        LRI_METALINK),
+    { NULL }
+};
+
+#undef HANDLE_ATTR
+
+/* Attribute of the option with the name or NULL */
+static const HandleAttr *
+find_option_attr(const char *name)
+{
+    for (PyGetSetDef *def = handle_getsetters; def->name; def++)
+        if (!strcmp(def->name, name))
+            return def->closure;
+    return NULL;
+}
+
+/* Only option attributes can be set, also on subclasses which have
+ * a __dict__, so misspelled option names are not silently accepted */
+static int
+handle_setattro(PyObject *self, PyObject *name, PyObject *value)
+{
+    const char *str;
+
+#if PY_MAJOR_VERSION >= 3
+    str = PyUnicode_AsUTF8(name);
+#else
+    str = PyString_AsString(name);
+#endif
+    if (!str)
+        return -1;
+
+    if (!find_option_attr(str)) {
+        PyErr_Format(PyExc_AttributeError,
+                     "'%.50s' object has no attribute '%.400s'",
+                     Py_TYPE(self)->tp_name, str);
+        return -1;
+    }
+
+    return PyObject_GenericSetAttr(self, name, value);
+}
+
+/* Set options passed as keyword arguments (attribute names) to Handle() */
+static int
+set_kwargs_options(_HandleObject *self, PyObject *kwds)
+{
+    Py_ssize_t pos = 0;
+    PyObject *key, *value;
+
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        const HandleAttr *attr;
+        const char *name;
+
+#if PY_MAJOR_VERSION >= 3
+        name = PyUnicode_AsUTF8(key);
+#else
+        name = PyString_AsString(key);
+#endif
+        if (!name)
+            return -1;
+
+        attr = find_option_attr(name);
+        if (!attr || attr->setopt == -1) {
+            PyErr_Format(PyExc_TypeError,
+                         "'%s' is an invalid keyword argument for Handle()",
+                         name);
+            return -1;
+        }
+
+        if (set_one_option(self, attr->setopt, value))
+            return -1;
+    }
+
+    return 0;
+}
+
+PyDoc_STRVAR(setopt__doc__,
+"setopt(option, val)\n\n"
+"Set option to :class:`.Handle` directly.\n\n"
+":param option: One of: :ref:`handle-options-label`\n"
+":returns: *None*\n\n"
+"Example::\n\n"
+"    # The command:\n"
+"    h.setopt(librepo.LRO_URLS, [\"http://ftp.linux.ncsu.edu/pub/fedora/linux/releases/17/Everything/i386/os/\"])\n"
+"    # is equivalent to:\n"
+"    h.urls = [\"http://ftp.linux.ncsu.edu/pub/fedora/linux/releases/17/Everything/i386/os/\"]\n");
+
+PyDoc_STRVAR(setopts__doc__,
+"setopts(options)\n\n"
+"Set multiple options to :class:`.Handle` at once.\n\n"
+":param options: Dict mapping options (:ref:`handle-options-label`)\n"
+"                to their values\n"
+":returns: *None*\n\n"
+"Example::\n\n"
+"    h.setopts({librepo.LRO_REPOTYPE: librepo.LR_YUMREPO,\n"
+"               librepo.LRO_DESTDIR: \"repo\"})\n");
+
+PyDoc_STRVAR(getinfo__doc__,
+"getinfo(option)\n\n"
+"Get information from :class:`.Handle`.\n\n"
+":param option: One of :ref:`handle-info-options-label`\n"
+":returns: Value for the specified option or\n"
+"          *None* if the option is not set.\n");
+
 static struct
 PyMethodDef handle_methods[] = {
-    { "setopt", (PyCFunction)py_setopt, METH_VARARGS, NULL },
-    { "getinfo", (PyCFunction)py_getinfo, METH_VARARGS, NULL },
+    { "setopt", (PyCFunction)(void(*)(void))py_setopt, HANDLE_OPTION_METH_FLAGS, setopt__doc__ },
+    { "getinfo", (PyCFunction)(void(*)(void))py_getinfo, HANDLE_OPTION_METH_FLAGS, getinfo__doc__ },
+    { "setopts", (PyCFunction)py_setopts, METH_O, setopts__doc__ },
     { "perform", (PyCFunction)py_perform, METH_VARARGS, NULL },
     { "download_package", (PyCFunction)py_download_package, METH_VARARGS, NULL },
     { NULL }
@@ -1120,7 +1595,7 @@ PyTypeObject Handle_Type = {
     0,                              /* tp_call */
     0,                              /* tp_str */
     0,                              /* tp_getattro */
-    0,                              /* tp_setattro */
+    handle_setattro,                /* tp_setattro */
     0,                              /* tp_as_buffer */
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE, /* tp_flags */
     "Handle object",                /* tp_doc */
@@ -1132,7 +1607,7 @@ PyTypeObject Handle_Type = {
     0,                              /* tp_iternext */
     handle_methods,                 /* tp_methods */
     0,                              /* tp_members */
-    0,                              /* tp_getset */
+    handle_getsetters,              /* tp_getset */
     0,                              /* tp_base */
     0,                              /* tp_dict */
     0,                              /* tp_descr_get */
@@ -106,13 +106,10 @@ result_dealloc(_ResultObject *o)
 }
 
 static PyObject *
-getinfo(_ResultObject *self, PyObject *args)
+getinfo_option(_ResultObject *self, int option)
 {
-    int option;
     gboolean res = TRUE;
 
-    if (!PyArg_ParseTuple(args, "i:getinfo", &option))
-        return NULL;
     if (check_ResultStatus(self))
         return NULL;
 
@@ -169,6 +166,43 @@ getinfo(_ResultObject *self, PyObject *args)
     Py_RETURN_NONE;
 }
 
+static PyObject *
+getinfo(_ResultObject *self, PyObject *args)
+{
+    int option;
+
+    if (!PyArg_ParseTuple(args, "i:getinfo", &option))
+        return NULL;
+
+    return getinfo_option(self, option);
+}
+
+/* Attributes
+ *
+ * Every LRR_* option is accessible also as an attribute of the Result
+ * object (lowercase option name without the prefix).
+ */
+
+static PyObject *
+get_result_attr(_ResultObject *self, void *closure)
+{
+    return getinfo_option(self, GPOINTER_TO_INT(closure));
+}
+
+#define RESULT_ATTR(name, lrr) \
+    { name, (getter) get_result_attr, NULL, NULL, GINT_TO_POINTER(lrr) }
+
+static PyGetSetDef result_getsetters[] = {
+    RESULT_ATTR("yum_repo",         LRR_YUM_REPO),
+    RESULT_ATTR("yum_repomd",       LRR_YUM_REPOMD),
+    RESULT_ATTR("yum_timestamp",    LRR_YUM_TIMESTAMP),
+    { NULL }
+};
+
+#undef RESULT_ATTR
+
+G_STATIC_ASSERT(G_N_ELEMENTS(result_getsetters) == LRR_SENTINEL + 1);
+
 static PyObject *
 clear(_ResultObject *self, G_GNUC_UNUSED PyObject *noarg)
 {
@@ -215,7 +249,7 @@ PyTypeObject Result_Type = {
     0,                              /* tp_iternext */
     result_methods,                 /* tp_methods */
     0,                              /* tp_members */
-    0,                              /* tp_getset */
+    result_getsetters,              /* tp_getset */
     0,                              /* tp_base */
     0,                              /* tp_dict */
     0,                              /* tp_descr_get */
@@ -1,4 +1,5 @@
 import unittest
+import weakref
 import librepo
 
 def foo_cb(data, total_to_download, downloaded):
@@ -169,9 +170,11 @@ class TestCaseHandle(unittest.TestCase):
         self.assertFalse(h.update)
 
         self.assertEqual(h.urls, [])
-        h.urls = "http://foo"
+        with self.assertWarns(DeprecationWarning):
+            h.urls = "http://foo"
         self.assertEqual(h.urls, ["http://foo"])
-        h.urls = ""
+        with self.assertWarns(DeprecationWarning):
+            h.urls = ""
         self.assertEqual(h.urls, [""])
         h.urls = None
         self.assertEqual(h.urls, [])
@@ -394,3 +397,56 @@ class TestCaseHandle(unittest.TestCase):
 
         h.setopt(librepo.LRO_GNUPGHOMEDIR, None)
         h.gnupghomedir = None
+
+    def test_handle_attr_errors(self):
+        """Unsupported attribute access raises AttributeError."""
+        h = librepo.Handle()
+
+        self.assertRaises(AttributeError, setattr, h, "foobar", 1)
+        self.assertRaises(AttributeError, getattr, h, "foobar")
+        self.assertRaises(AttributeError, setattr, h, "mirrors", [])
+        self.assertRaises(AttributeError, getattr, h, "httpauth")
+
+        # Subclasses have a __dict__, but unknown names are rejected too
+        class SubHandle(librepo.Handle):
+            pass
+        h = SubHandle()
+        self.assertRaises(AttributeError, setattr, h, "foobar", 1)
+        h.destdir = "foodir"
+        self.assertEqual(h.destdir, "foodir")
+
+    def test_handle_urls_string(self):
+        """String value of LRO_URLS is deprecated but still accepted."""
+        h = librepo.Handle()
+        with self.assertWarns(DeprecationWarning):
+            h.setopt(librepo.LRO_URLS, "http://foo")
+        self.assertEqual(h.urls, ["http://foo"])
+        with self.assertWarns(DeprecationWarning):
+            h.urls = "http://bar"
+        self.assertEqual(h.urls, ["http://bar"])
+        with self.assertWarns(DeprecationWarning):
+            self.assertRaises(TypeError, h.setopt, librepo.LRO_URLS, 1)
+
+    def test_handle_weakref(self):
+        """Weak references to Handle are supported."""
+        h = librepo.Handle()
+        ref = weakref.ref(h)
+        self.assertTrue(ref() is h)
+
+    def test_handle_setopts(self):
+        """Options set at once via setopts() and Handle() keywords."""
+        h = librepo.Handle()
+        h.setopts({librepo.LRO_DESTDIR: "foodir",
+                   librepo.LRO_REPOTYPE: librepo.LR_YUMREPO})
+        self.assertEqual(h.getinfo(librepo.LRI_DESTDIR), "foodir")
+        self.assertEqual(h.getinfo(librepo.LRI_REPOTYPE), librepo.LR_YUMREPO)
+        h.setopts({})
+
+        self.assertRaises(TypeError, h.setopts, [])
+        self.assertRaises(TypeError, h.setopts, {"destdir": "foodir"})
+        self.assertRaises(TypeError, h.setopts, {librepo.LRO_DESTDIR: 1})
+
+        h = librepo.Handle(destdir="bardir", repotype=librepo.LR_YUMREPO)
+        self.assertEqual(h.destdir, "bardir")
+        self.assertEqual(h.repotype, librepo.LR_YUMREPO)
+        self.assertRaises(TypeError, librepo.Handle, foobar=1)
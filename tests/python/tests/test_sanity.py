@@ -27,6 +27,15 @@ class TestCaseSanity(unittest.TestCase):
         self.assertEqual(r.yum_repo, None)
         self.assertEqual(r.yum_repomd, None)
 
+    def test_result_subclass_attr(self):
+        class SubResult(librepo.Result):
+            @property
+            def yum_repo(self):
+                return "foo"
+        r = SubResult()
+        self.assertEqual(r.yum_repo, "foo")
+        self.assertEqual(r.yum_timestamp, None)
+
     def test_raw_result_sanity(self):
         t = librepo.PackageTarget("foo")
         self.assertEqual(t.handle, None)